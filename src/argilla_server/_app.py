@@ -30,6 +30,8 @@ from starlette.responses import RedirectResponse
 
 from argilla_server import helpers
 from argilla_server._version import __version__ as argilla_version
+from argilla_server.apis.routing import LazyAPIRoute
+from argilla_server.cache_control import CacheControlMiddleware
 from argilla_server.constants import DEFAULT_API_KEY, DEFAULT_PASSWORD, DEFAULT_USERNAME
 from argilla_server.contexts import accounts
 from argilla_server.daos.backend import GenericElasticEngineBackend
@@ -53,7 +55,7 @@ from argilla_server.logging import configure_logging
 from argilla_server.models import User
 from argilla_server.pydantic_v1 import ValidationError
 from argilla_server.pydantic_v1.errors import ConfigError
-from argilla_server.routes import api_router
+from argilla_server.routes import create_api_router
 from argilla_server.security import auth
 from argilla_server.settings import settings
 from argilla_server.static_rewrite import RewriteStaticFiles
@@ -116,6 +118,8 @@ def configure_middleware(app: FastAPI):
         allow_headers=["*"],
     )
 
+    app.add_middleware(CacheControlMiddleware)
+
     app.add_middleware(BrotliMiddleware, minimum_size=512, quality=7)
 
 
@@ -138,7 +142,11 @@ def configure_api_exceptions(api: FastAPI):
 
 def configure_api_router(app: FastAPI):
     """Configures and set the api router to app"""
-    app.include_router(api_router, prefix="/api")
+    app.include_router(create_api_router(), prefix="/api")
+
+    for route in app.routes:
+        if isinstance(route, LazyAPIRoute):
+            route.initialize()
 
 
 def configure_app_statics(app: FastAPI):
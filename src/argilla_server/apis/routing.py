@@ -0,0 +1,92 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import inspect
+from enum import IntEnum
+from typing import Any, Callable
+
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.dependencies.utils import get_typed_return_annotation
+from fastapi.routing import APIRoute
+from starlette.responses import Response
+from starlette.routing import get_name
+
+_API_ROUTE_DEFAULTS = {
+    name: parameter.default
+    for name, parameter in inspect.signature(APIRoute.__init__).parameters.items()
+    if parameter.kind == inspect.Parameter.KEYWORD_ONLY
+}
+
+
+class LazyAPIRoute(APIRoute):
+    """
+    APIRoute deferring the expensive route analysis (dependant, body and response fields, request handler...)
+    until the route is used for the first time.
+
+    `include_router` re-creates every route of the included router, so a route declared in a handler module
+    is built once per nesting level. Only the declaration attributes read when including a router are computed
+    on creation, so the full initialization only happens for the routes finally served by the application.
+    Those routes should be initialized with `initialize` once the application is built, so route definition
+    errors are raised on startup and not when serving requests.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        for name, default in _API_ROUTE_DEFAULTS.items():
+            setattr(self, name, kwargs.get(name, default))
+
+        self.path = path
+        self.endpoint = endpoint
+        self.name = get_name(endpoint) if self.name is None else self.name
+        self.methods = {method.upper() for method in self.methods or ["GET"]}
+        self.tags = self.tags or []
+        self.responses = self.responses or {}
+        self.dependencies = list(self.dependencies or [])
+        self.description = (self.description or inspect.cleandoc(endpoint.__doc__ or "")).split("\f")[0].strip()
+
+        if isinstance(self.status_code, IntEnum):
+            self.status_code = int(self.status_code)
+
+        if isinstance(self.response_model, DefaultPlaceholder):
+            return_annotation = get_typed_return_annotation(endpoint)
+            is_response = inspect.isclass(return_annotation) and issubclass(return_annotation, Response)
+            self.response_model = None if is_response else return_annotation
+
+        self.__dict__["_deferred_init"] = (path, endpoint, kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        if "_deferred_init" not in self.__dict__ or "_initializing" in self.__dict__:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+        self.initialize()
+
+        return getattr(self, name)
+
+    def initialize(self) -> None:
+        """
+        Runs the deferred `APIRoute` initialization if it is still pending. If the initialization fails, the route
+        is kept pending so the same error is raised again instead of serving a partially initialized route.
+        """
+        deferred_init = self.__dict__.get("_deferred_init")
+        if deferred_init is None:
+            return
+
+        path, endpoint, kwargs = deferred_init
+
+        self.__dict__["_initializing"] = True
+        try:
+            super().__init__(path, endpoint, **kwargs)
+        finally:
+            del self.__dict__["_initializing"]
+
+        del self.__dict__["_deferred_init"]
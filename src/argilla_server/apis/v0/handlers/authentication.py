@@ -15,6 +15,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.contexts import accounts
 from argilla_server.database import get_async_db
 from argilla_server.errors import UnauthorizedError
@@ -22,7 +23,7 @@ from argilla_server.schemas.v0.authentication import Token, UserPasswordRequestF
 from argilla_server.security.authentication.jwt import JWT
 from argilla_server.security.authentication.userinfo import UserInfo
 
-router = APIRouter(tags=["Authentication"])
+router = APIRouter(tags=["Authentication"], route_class=LazyAPIRoute)
 
 
 @router.post("/security/token", response_model=Token)
@@ -17,6 +17,7 @@ from typing import List
 
 from fastapi import APIRouter, Body, Depends, Security
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.apis.v0.helpers import deprecate_endpoint
 from argilla_server.apis.v0.models.commons.params import (
     CommonTaskHandlerDependencies,
@@ -29,7 +30,7 @@ from argilla_server.schemas.v0.datasets import CopyDatasetRequest, CreateDataset
 from argilla_server.security import auth
 from argilla_server.services.datasets import DatasetsService
 
-router = APIRouter(tags=["datasets"], prefix="/datasets")
+router = APIRouter(tags=["datasets"], prefix="/datasets", route_class=LazyAPIRoute)
 
 
 @deprecate_endpoint(
@@ -15,9 +15,10 @@
 
 from fastapi import APIRouter, Depends
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.services.info import ApiInfo, ApiInfoService, ApiStatus
 
-router = APIRouter(tags=["status"])
+router = APIRouter(tags=["status"], route_class=LazyAPIRoute)
 
 
 @router.get("/_status", operation_id="api_status", response_model=ApiStatus)
@@ -18,6 +18,7 @@ from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, Query, Request, Security
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.apis.v0.helpers import deprecate_endpoint
 from argilla_server.apis.v0.models.commons.params import CommonTaskHandlerDependencies
 from argilla_server.commons.config import TaskConfig, TasksFactory
@@ -124,6 +125,6 @@ def configure_router(router: APIRouter, cfg: TaskConfig):
         )
 
 
-router = APIRouter(tags=["Metrics"], prefix="/datasets")
+router = APIRouter(tags=["Metrics"], prefix="/datasets", route_class=LazyAPIRoute)
 for cfg in TasksFactory.get_all_configs():
     configure_router(router, cfg)
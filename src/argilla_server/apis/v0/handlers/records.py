@@ -16,6 +16,7 @@ from typing import Optional, Union
 
 from fastapi import APIRouter, Depends, Query, Security
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.apis.v0.models.commons.params import CommonTaskHandlerDependencies
 from argilla_server.apis.v0.models.text2text import Text2TextQuery, Text2TextRecord
 from argilla_server.apis.v0.models.text_classification import TextClassificationQuery, TextClassificationRecord
@@ -102,5 +103,5 @@ def configure_router(router: APIRouter):
         )
 
 
-router = APIRouter(tags=["datasets"], prefix="/datasets")
+router = APIRouter(tags=["datasets"], prefix="/datasets", route_class=LazyAPIRoute)
 configure_router(router)
@@ -16,6 +16,7 @@ from typing import List, Optional, Union
 
 from fastapi import APIRouter, Depends, Query, Security
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.apis.v0.models.commons.model import SortableField
 from argilla_server.apis.v0.models.commons.params import CommonTaskHandlerDependencies
 from argilla_server.apis.v0.models.text2text import Text2TextQuery
@@ -103,5 +104,5 @@ def configure_router(router: APIRouter):
         return ScanDatasetRecordsResponse(next_idx=next_idx, next_page_cfg=paginated_sort.json(), records=docs)
 
 
-router = APIRouter(tags=["datasets"], prefix="/datasets")
+router = APIRouter(tags=["datasets"], prefix="/datasets", route_class=LazyAPIRoute)
 configure_router(router)
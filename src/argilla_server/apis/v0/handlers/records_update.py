@@ -16,6 +16,7 @@ from typing import Any, Dict, Optional, Union
 
 from fastapi import APIRouter, Depends, Security
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.apis.v0.models.commons.params import CommonTaskHandlerDependencies
 from argilla_server.apis.v0.models.text2text import Text2TextRecord
 from argilla_server.apis.v0.models.text_classification import TextClassificationRecord
@@ -76,5 +77,5 @@ def configure_router(router: APIRouter):
         )
 
 
-router = APIRouter(tags=["records"], prefix="/datasets")
+router = APIRouter(tags=["records"], prefix="/datasets", route_class=LazyAPIRoute)
 configure_router(router)
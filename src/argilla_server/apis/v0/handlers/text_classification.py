@@ -17,6 +17,7 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Query, Security
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.apis.v0.handlers import metrics, text_classification_dataset_settings
 from argilla_server.apis.v0.helpers import deprecate_endpoint
 from argilla_server.apis.v0.models.commons.model import BulkResponse
@@ -62,7 +63,7 @@ def configure_router():
         metrics=TextClassificationMetrics,
     )
 
-    router = APIRouter(tags=[task_type], prefix="/datasets")
+    router = APIRouter(tags=[task_type], prefix="/datasets", route_class=LazyAPIRoute)
 
     @router.post(
         f"{base_endpoint}:bulk",
@@ -15,6 +15,7 @@
 
 from fastapi import APIRouter, Depends, Query, Security
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.apis.v0.handlers import metrics, token_classification_dataset_settings
 from argilla_server.apis.v0.models.commons.model import BulkResponse
 from argilla_server.apis.v0.models.commons.params import CommonTaskHandlerDependencies, RequestPagination
@@ -51,7 +52,7 @@ def configure_router():
         metrics=TokenClassificationMetrics,
     )
 
-    router = APIRouter(tags=[task_type], prefix="/datasets")
+    router = APIRouter(tags=[task_type], prefix="/datasets", route_class=LazyAPIRoute)
 
     @router.post(
         path=f"{base_endpoint}:bulk",
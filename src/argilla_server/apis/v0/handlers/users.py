@@ -20,6 +20,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request, Security, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from argilla_server import models, telemetry
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.contexts import accounts
 from argilla_server.database import get_async_db
 from argilla_server.errors import EntityAlreadyExistsError, EntityNotFoundError
@@ -28,7 +29,7 @@ from argilla_server.pydantic_v1 import parse_obj_as
 from argilla_server.schemas.v0.users import User, UserCreate
 from argilla_server.security import auth
 
-router = APIRouter(tags=["users"])
+router = APIRouter(tags=["users"], route_class=LazyAPIRoute)
 
 
 @router.get("/me", response_model=User, response_model_exclude_none=True, operation_id="whoami")
@@ -18,6 +18,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Security
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.contexts import accounts
 from argilla_server.database import get_async_db
 from argilla_server.errors import EntityAlreadyExistsError, EntityNotFoundError
@@ -27,7 +28,7 @@ from argilla_server.schemas.v0.users import User
 from argilla_server.schemas.v0.workspaces import Workspace, WorkspaceCreate, WorkspaceUserCreate
 from argilla_server.security import auth
 
-router = APIRouter(tags=["workspaces"])
+router = APIRouter(tags=["workspaces"], route_class=LazyAPIRoute)
 
 
 @router.get("/workspaces", response_model=List[Workspace], response_model_exclude_none=True)
@@ -14,9 +14,10 @@
 
 from fastapi import APIRouter
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.apis.v1.handlers.datasets.datasets import router as datasets_router
 from argilla_server.apis.v1.handlers.datasets.records import router as records_router
 
-router = APIRouter(tags=["datasets"])
+router = APIRouter(tags=["datasets"], route_class=LazyAPIRoute)
 router.include_router(datasets_router)
 router.include_router(records_router)
@@ -18,6 +18,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Security, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.contexts import accounts, datasets
 from argilla_server.database import get_async_db
 from argilla_server.enums import ResponseStatusFilter
@@ -44,7 +45,7 @@ from argilla_server.telemetry import TelemetryClient, get_telemetry_client
 
 CREATE_DATASET_VECTOR_SETTINGS_MAX_COUNT = 5
 
-router = APIRouter()
+router = APIRouter(route_class=LazyAPIRoute)
 
 
 async def _get_dataset(
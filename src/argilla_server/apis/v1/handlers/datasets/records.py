@@ -22,6 +22,7 @@ from typing_extensions import Annotated
 
 import argilla_server.errors.future as errors
 import argilla_server.search_engine as search_engine
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.apis.v1.handlers.datasets.datasets import _get_dataset
 from argilla_server.contexts import datasets, search
 from argilla_server.database import get_async_db
@@ -102,7 +103,7 @@ parse_record_include_param = parse_query_param(
     name="include", help="Relationships to include in the response", model=RecordIncludeParam
 )
 
-router = APIRouter()
+router = APIRouter(route_class=LazyAPIRoute)
 
 
 async def _filter_records_using_search_engine(
@@ -18,6 +18,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Security, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.contexts import datasets
 from argilla_server.database import get_async_db
 from argilla_server.models import User
@@ -29,7 +30,7 @@ from argilla_server.security import auth
 if TYPE_CHECKING:
     from argilla_server.models import Field
 
-router = APIRouter(tags=["fields"])
+router = APIRouter(tags=["fields"], route_class=LazyAPIRoute)
 
 
 async def _get_field(db: "AsyncSession", field_id: UUID) -> "Field":
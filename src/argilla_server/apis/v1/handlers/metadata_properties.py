@@ -17,6 +17,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Security, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.contexts import datasets
 from argilla_server.database import get_async_db
 from argilla_server.models import MetadataProperty, User
@@ -25,7 +26,7 @@ from argilla_server.schemas.v1.metadata_properties import MetadataMetrics, Metad
 from argilla_server.search_engine import SearchEngine, get_search_engine
 from argilla_server.security import auth
 
-router = APIRouter(tags=["metadata properties"])
+router = APIRouter(tags=["metadata properties"], route_class=LazyAPIRoute)
 
 
 async def _get_metadata_property(db: "AsyncSession", metadata_property_id: UUID) -> "MetadataProperty":
@@ -17,6 +17,7 @@ from fastapi.responses import RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from argilla_server import telemetry
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.contexts import accounts
 from argilla_server.database import get_async_db
 from argilla_server.enums import UserRole
@@ -28,7 +29,7 @@ from argilla_server.security.authentication.oauth2 import OAuth2ClientProvider
 from argilla_server.security.authentication.userinfo import UserInfo
 from argilla_server.security.settings import settings
 
-router = APIRouter(prefix="/oauth2", tags=["Authentication"])
+router = APIRouter(prefix="/oauth2", tags=["Authentication"], route_class=LazyAPIRoute)
 
 
 _USER_ROLE_ON_CREATION = UserRole.annotator
@@ -17,6 +17,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Security, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.contexts import datasets
 from argilla_server.database import get_async_db
 from argilla_server.models import Question, User
@@ -25,7 +26,7 @@ from argilla_server.schemas.v1.questions import Question as QuestionSchema
 from argilla_server.schemas.v1.questions import QuestionUpdate
 from argilla_server.security import auth
 
-router = APIRouter(tags=["questions"])
+router = APIRouter(tags=["questions"], route_class=LazyAPIRoute)
 
 
 async def _get_question(db: "AsyncSession", question_id: UUID) -> Question:
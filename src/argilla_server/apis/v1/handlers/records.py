@@ -19,6 +19,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Security, status
 from fastapi import Response as HTTPResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.contexts import datasets
 from argilla_server.database import get_async_db
 from argilla_server.models import Record, User
@@ -33,7 +34,7 @@ from argilla_server.utils import parse_uuids
 
 DELETE_RECORD_SUGGESTIONS_LIMIT = 100
 
-router = APIRouter(tags=["records"])
+router = APIRouter(tags=["records"], route_class=LazyAPIRoute)
 
 
 async def _get_record(
@@ -17,6 +17,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Security, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.contexts import datasets
 from argilla_server.database import get_async_db
 from argilla_server.errors.future import NotFoundError
@@ -35,7 +36,7 @@ from argilla_server.use_cases.responses.upsert_responses_in_bulk import (
     UpsertResponsesInBulkUseCaseFactory,
 )
 
-router = APIRouter(tags=["responses"])
+router = APIRouter(tags=["responses"], route_class=LazyAPIRoute)
 
 
 async def _get_response(db: AsyncSession, response_id: UUID) -> Response:
@@ -17,15 +17,21 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Security, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.contexts import datasets
 from argilla_server.database import get_async_db
 from argilla_server.models import Suggestion, User
 from argilla_server.policies import SuggestionPolicyV1, authorize
 from argilla_server.schemas.v1.suggestions import Suggestion as SuggestionSchema
+from argilla_server.schemas.v1.suggestions import SuggestionsBulk, SuggestionsBulkCreate
 from argilla_server.search_engine import SearchEngine, get_search_engine
 from argilla_server.security import auth
+from argilla_server.use_cases.suggestions.upsert_suggestions_in_bulk import (
+    UpsertSuggestionsInBulkUseCase,
+    UpsertSuggestionsInBulkUseCaseFactory,
+)
 
-router = APIRouter(tags=["suggestions"])
+router = APIRouter(tags=["suggestions"], route_class=LazyAPIRoute)
 
 
 async def _get_suggestion(db: "AsyncSession", suggestion_id: UUID) -> Suggestion:
@@ -38,6 +44,18 @@ async def _get_suggestion(db: "AsyncSession", suggestion_id: UUID) -> Suggestion
     return suggestion
 
 
+@router.post("/suggestions/bulk", response_model=SuggestionsBulk)
+async def upsert_suggestions_bulk(
+    *,
+    body: SuggestionsBulkCreate,
+    current_user: User = Security(auth.get_current_user),
+    use_case: UpsertSuggestionsInBulkUseCase = Depends(UpsertSuggestionsInBulkUseCaseFactory()),
+):
+    suggestions_bulk_items = await use_case.execute(body.items, user=current_user)
+
+    return SuggestionsBulk(items=suggestions_bulk_items)
+
+
 @router.delete("/suggestions/{suggestion_id}", response_model=SuggestionSchema)
 async def delete_suggestion(
     *,
@@ -17,6 +17,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Security, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.contexts import accounts
 from argilla_server.database import get_async_db
 from argilla_server.models import User
@@ -24,7 +25,7 @@ from argilla_server.policies import UserPolicyV1, authorize
 from argilla_server.schemas.v1.workspaces import Workspaces
 from argilla_server.security import auth
 
-router = APIRouter(tags=["users"])
+router = APIRouter(tags=["users"], route_class=LazyAPIRoute)
 
 
 @router.get("/users/{user_id}/workspaces", response_model=Workspaces)
@@ -17,6 +17,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Security, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.contexts import datasets
 from argilla_server.database import get_async_db
 from argilla_server.models import User, VectorSettings
@@ -25,7 +26,7 @@ from argilla_server.schemas.v1.vector_settings import VectorSettings as VectorSe
 from argilla_server.schemas.v1.vector_settings import VectorSettingsUpdate
 from argilla_server.security import auth
 
-router = APIRouter(tags=["vectors-settings"])
+router = APIRouter(tags=["vectors-settings"], route_class=LazyAPIRoute)
 
 
 async def _get_vector_settings(db: AsyncSession, vector_settings_id: UUID) -> VectorSettings:
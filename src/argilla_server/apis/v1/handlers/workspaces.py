@@ -17,6 +17,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Security, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argilla_server.apis.routing import LazyAPIRoute
 from argilla_server.contexts import accounts, datasets
 from argilla_server.database import get_async_db
 from argilla_server.models import User
@@ -25,7 +26,7 @@ from argilla_server.schemas.v1.workspaces import Workspace, Workspaces
 from argilla_server.security import auth
 from argilla_server.services.datasets import DatasetsService
 
-router = APIRouter(tags=["workspaces"])
+router = APIRouter(tags=["workspaces"], route_class=LazyAPIRoute)
 
 
 @router.get("/workspaces/{workspace_id}", response_model=Workspace)
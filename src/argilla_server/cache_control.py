@@ -0,0 +1,97 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import re
+from typing import List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+DATASET_SETTINGS_PATH_REGEX = re.compile(
+    r"/api/v1/(?:me/)?datasets/[^/]+/(?:fields|questions|metadata-properties|vectors-settings)$"
+)
+# Responses are always revalidated using the `ETag`, so updated dataset settings are never served from a stale cache
+DATASET_SETTINGS_CACHE_CONTROL = "private, no-cache"
+
+
+def _opaque_tag(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _if_none_match(if_none_match: Optional[str], etag: str) -> bool:
+    """Checks whether an `If-None-Match` header value matches the given entity tag, using weak comparison"""
+    if if_none_match is None:
+        return False
+
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+
+    return "*" in tags or _opaque_tag(etag) in {_opaque_tag(tag) for tag in tags}
+
+
+class CacheControlMiddleware:
+    """
+    Raw ASGI middleware adding `Cache-Control` and `ETag` headers to successful GET responses for dataset
+    settings endpoints (fields, questions, metadata properties and vectors settings).
+
+    Clients must revalidate cached responses on every request. Requests including an `If-None-Match` header matching
+    the response `ETag` get an empty 304 response, so unchanged settings are not transferred again.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET" or not DATASET_SETTINGS_PATH_REGEX.search(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        response_start: Message = {}
+        body_chunks: List[bytes] = []
+
+        async def send_with_cache_headers(message: Message) -> None:
+            nonlocal response_start
+
+            if message["type"] == "http.response.start":
+                response_start = message
+                if message["status"] != 200:
+                    await send(message)
+                return
+
+            if response_start["status"] != 200:
+                await send(message)
+                return
+
+            body_chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_chunks)
+            # Weak validator, since BrotliMiddleware may send compressed and uncompressed representations of the body
+            etag = f'W/"{hashlib.sha256(body).hexdigest()}"'
+
+            headers = MutableHeaders(scope=response_start)
+            headers["Cache-Control"] = DATASET_SETTINGS_CACHE_CONTROL
+            headers["ETag"] = etag
+
+            if _if_none_match(Headers(scope=scope).get("if-none-match"), etag):
+                del headers["Content-Length"]
+                await send({**response_start, "status": 304})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send(response_start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_with_cache_headers)
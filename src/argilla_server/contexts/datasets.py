@@ -50,7 +50,6 @@ from argilla_server.models import (
     Vector,
     VectorSettings,
 )
-from argilla_server.models.suggestions import SuggestionCreateWithRecordId
 from argilla_server.schemas.v0.users import User
 from argilla_server.schemas.v1.datasets import (
     DatasetCreate,
@@ -72,6 +71,7 @@ from argilla_server.schemas.v1.responses import (
     ResponseValueCreate,
     ResponseValueUpdate,
 )
+from argilla_server.schemas.v1.suggestions import SuggestionCreateWithRecordId
 from argilla_server.schemas.v1.vector_settings import (
     VectorSettings as VectorSettingsSchema,
 )
@@ -1182,6 +1182,37 @@ async def upsert_suggestion(
     return suggestion
 
 
+async def _preload_suggestions_relationships_before_index(db: "AsyncSession", suggestions: List[Suggestion]) -> None:
+    await db.execute(
+        select(Suggestion)
+        .filter(Suggestion.id.in_([suggestion.id for suggestion in suggestions]))
+        .options(
+            selectinload(Suggestion.record).selectinload(Record.dataset),
+            selectinload(Suggestion.question),
+        )
+    )
+
+
+async def upsert_suggestions(
+    db: "AsyncSession", search_engine: SearchEngine, suggestions_upsert: List[SuggestionCreateWithRecordId]
+) -> List[Suggestion]:
+    """Upsert already validated suggestions using a single insert statement."""
+    async with db.begin_nested():
+        suggestions = await Suggestion.upsert_many(
+            db,
+            objects=suggestions_upsert,
+            constraints=[Suggestion.record_id, Suggestion.question_id],
+            autocommit=False,
+        )
+        await _preload_suggestions_relationships_before_index(db, suggestions)
+        for suggestion in suggestions:
+            await search_engine.update_record_suggestion(suggestion)
+
+    await db.commit()
+
+    return suggestions
+
+
 async def delete_suggestions(
     db: "AsyncSession", search_engine: SearchEngine, record: Record, suggestions_ids: List[UUID]
 ) -> None:
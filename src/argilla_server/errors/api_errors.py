@@ -12,7 +12,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Any, Dict
+import asyncio
+import functools
+import logging
+from typing import Any, Dict, Optional, Set
 
 from fastapi import HTTPException, Request
 from fastapi.exception_handlers import http_exception_handler
@@ -27,6 +30,20 @@ from argilla_server.errors.base_errors import (
 )
 from argilla_server.pydantic_v1 import BaseModel
 
+_LOGGER = logging.getLogger("argilla")
+
+# Max number of error tracking tasks running at the same time. New errors are not tracked once reached
+_MAX_TRACK_ERROR_TASKS = 100
+_TRACK_ERROR_TASKS: Set[asyncio.Task] = set()
+
+# Errors including the entity or exception type in the tracked data
+_TYPED_ERRORS = (GenericServerError, EntityNotFoundError, EntityAlreadyExistsError)
+
+
+def _log_track_error_task_exception(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        _LOGGER.warning("Error tracking server error", exc_info=task.exception())
+
 
 class ErrorDetail(BaseModel):
     code: str
@@ -38,27 +55,50 @@ class ServerHTTPException(HTTPException):
     def __init__(self, error: ServerError):
         super().__init__(
             status_code=error.HTTP_STATUS,
-            detail=ErrorDetail(code=error.code, params=error.arguments).dict(),
+            detail=ErrorDetail.construct(code=error.code, params=error.arguments or {}).dict(),
         )
 
 
 class APIErrorHandler:
     @staticmethod
-    async def track_error(error: ServerError, request: Request):
+    async def track_error(
+        error: ServerError, request: Request, telemetry_client: Optional[telemetry.TelemetryClient] = None
+    ):
+        telemetry_client = telemetry_client or telemetry.get_telemetry_client()
+        headers = request.headers
         data = {
             "code": error.code,
-            "user-agent": request.headers.get("user-agent"),
-            "accept-language": request.headers.get("accept-language"),
+            "user-agent": headers.get("user-agent"),
+            "accept-language": headers.get("accept-language"),
         }
-        if isinstance(error, (GenericServerError, EntityNotFoundError, EntityAlreadyExistsError)):
+        if isinstance(error, _TYPED_ERRORS):
             data["type"] = error.type
 
-        telemetry.get_telemetry_client().track_data(action="ServerErrorFound", data=data)
+        track_data = functools.partial(
+            telemetry_client.track_data,
+            action="ServerErrorFound",
+            data=data,
+        )
+        await asyncio.get_running_loop().run_in_executor(None, track_data)
+
+    @staticmethod
+    def track_error_in_background(error: ServerError, request: Request):
+        """Tracks the error without waiting for it, so the error response is not delayed by telemetry"""
+        telemetry_client = telemetry.get_telemetry_client()
+        if not telemetry_client.enabled or len(_TRACK_ERROR_TASKS) >= _MAX_TRACK_ERROR_TASKS:
+            return
+
+        task = asyncio.create_task(
+            APIErrorHandler.track_error(error, request=request, telemetry_client=telemetry_client)
+        )
+        _TRACK_ERROR_TASKS.add(task)
+        task.add_done_callback(_TRACK_ERROR_TASKS.discard)
+        task.add_done_callback(_log_track_error_task_exception)
 
     @staticmethod
     async def common_exception_handler(request: Request, error: Exception):
         """Wraps errors as custom generic error"""
         argilla_error = exception_to_argilla_error(error)
-        await APIErrorHandler.track_error(argilla_error, request=request)
+        APIErrorHandler.track_error_in_background(argilla_error, request=request)
 
         return await http_exception_handler(request, ServerHTTPException(argilla_error))
@@ -12,7 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Any, Optional, Type, Union
+import functools
+from typing import Any, Dict, Optional, Type, Union
 
 import pydantic
 from starlette import status
@@ -20,8 +21,15 @@ from starlette import status
 
 class ServerError(Exception):
     HTTP_STATUS: int = status.HTTP_500_INTERNAL_SERVER_ERROR
+    # OpenAPI response documentation, computed once when the error class is defined
+    OPENAPI_RESPONSE: Dict[str, Any]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.OPENAPI_RESPONSE = cls.api_documentation()
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def api_documentation(cls):
         return {
             "content": {
@@ -54,6 +62,9 @@ class ServerError(Exception):
         return f"{self.code}({printable_args})"
 
 
+ServerError.OPENAPI_RESPONSE = ServerError.api_documentation()
+
+
 class ValidationError(ServerError):
     """Generic data validation error out of request"""
 
@@ -70,6 +81,7 @@ class GenericServerError(ServerError):
         self.args = error.args
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def api_documentation(cls):
         return {
             "content": {"application/json": {"example": {"detail": {"code": "builtins.TypeError"}}}},
@@ -186,7 +198,7 @@ class MissingDatasetRecordsError(BadRequestError):
         self.message = message
 
 
-__ALL__ = [
+__ALL__ = (
     BadRequestError,
     EntityNotFoundError,
     ForbiddenOperationError,
@@ -195,4 +207,4 @@ __ALL__ = [
     GenericServerError,
     ClosedDatasetError,
     MissingDatasetRecordsError,
-]
+)
@@ -18,70 +18,69 @@ This module configures the api routes under /api prefix, and
 set the required security dependencies if api security is enabled
 """
 
+import importlib
+from types import MappingProxyType
+
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 
-from argilla_server.apis.v0.handlers import (
-    authentication,
-    datasets,
-    info,
-    metrics,
-    records,
-    records_search,
-    records_update,
-    text2text,
-    text_classification,
-    token_classification,
-    users,
-    workspaces,
-)
-from argilla_server.apis.v1.handlers import datasets as datasets_v1
-from argilla_server.apis.v1.handlers import fields as fields_v1
-from argilla_server.apis.v1.handlers import metadata_properties as metadata_properties_v1
-from argilla_server.apis.v1.handlers import oauth2 as oauth2_v1
-from argilla_server.apis.v1.handlers import questions as questions_v1
-from argilla_server.apis.v1.handlers import records as records_v1
-from argilla_server.apis.v1.handlers import responses as responses_v1
-from argilla_server.apis.v1.handlers import suggestions as suggestions_v1
-from argilla_server.apis.v1.handlers import users as users_v1
-from argilla_server.apis.v1.handlers import vectors_settings as vectors_settings_v1
-from argilla_server.apis.v1.handlers import workspaces as workspaces_v1
 from argilla_server.errors.base_errors import __ALL__
+from argilla_server.settings import settings
+
+# Handler modules are imported when the api router is created, so only the enabled API versions are loaded
+_API_V0_HANDLERS = [
+    "argilla_server.apis.v0.handlers.authentication",
+    "argilla_server.apis.v0.handlers.users",
+    "argilla_server.apis.v0.handlers.workspaces",
+    "argilla_server.apis.v0.handlers.datasets",
+    "argilla_server.apis.v0.handlers.info",
+    "argilla_server.apis.v0.handlers.metrics",
+    "argilla_server.apis.v0.handlers.records",
+    "argilla_server.apis.v0.handlers.records_search",
+    "argilla_server.apis.v0.handlers.records_update",
+    "argilla_server.apis.v0.handlers.text_classification",
+    "argilla_server.apis.v0.handlers.token_classification",
+    "argilla_server.apis.v0.handlers.text2text",
+]
 
-api_router = APIRouter(responses={error.HTTP_STATUS: error.api_documentation() for error in __ALL__})
+_API_V1_HANDLERS = [
+    "argilla_server.apis.v1.handlers.datasets",
+    "argilla_server.apis.v1.handlers.fields",
+    "argilla_server.apis.v1.handlers.questions",
+    "argilla_server.apis.v1.handlers.metadata_properties",
+    "argilla_server.apis.v1.handlers.records",
+    "argilla_server.apis.v1.handlers.responses",
+    "argilla_server.apis.v1.handlers.suggestions",
+    "argilla_server.apis.v1.handlers.users",
+    "argilla_server.apis.v1.handlers.vectors_settings",
+    "argilla_server.apis.v1.handlers.workspaces",
+    "argilla_server.apis.v1.handlers.oauth2",
+]
 
+# Error responses are only declared on the outermost router so they are merged once into every route.
+# Errors sharing the same HTTP status are documented by the last one declared in `__ALL__`.
+_SHARED_RESPONSES = MappingProxyType({error.HTTP_STATUS: error.OPENAPI_RESPONSE for error in __ALL__})
 
-dependencies = []
 
-for router in [
-    authentication.router,
-    users.router,
-    workspaces.router,
-    datasets.router,
-    info.router,
-    metrics.router,
-    records.router,
-    records_search.router,
-    records_update.router,
-    text_classification.router,
-    token_classification.router,
-    text2text.router,
-]:
-    api_router.include_router(router, dependencies=dependencies)
+async def endpoint_not_found_controller(request: Request):
+    raise HTTPException(status_code=404, detail=f"Endpoint {request.url.path!r} not found")
 
-# API v1
-api_router.include_router(datasets_v1.router, prefix="/v1")
-api_router.include_router(fields_v1.router, prefix="/v1")
-api_router.include_router(questions_v1.router, prefix="/v1")
-api_router.include_router(metadata_properties_v1.router, prefix="/v1")
-api_router.include_router(records_v1.router, prefix="/v1")
-api_router.include_router(responses_v1.router, prefix="/v1")
-api_router.include_router(suggestions_v1.router, prefix="/v1")
-api_router.include_router(users_v1.router, prefix="/v1")
-api_router.include_router(vectors_settings_v1.router, prefix="/v1")
-api_router.include_router(workspaces_v1.router, prefix="/v1")
-api_router.include_router(oauth2_v1.router, prefix="/v1")
 
+def create_api_router() -> APIRouter:
+    """Creates the api router including the handlers of the enabled API versions"""
+    api_router = APIRouter(responses=_SHARED_RESPONSES, default_response_class=ORJSONResponse)
 
-@api_router.route("/{_:path}", methods=["GET", "POST", "PUT", "DELETE", "PATCH"], include_in_schema=False)
-def endpoint_not_found_controller(request: Request):
-    raise HTTPException(status_code=404, detail=f"Endpoint {request.url.path!r} not found")
+    handlers = [(module, "") for module in _API_V0_HANDLERS] if settings.enable_api_v0 else []
+    handlers += [(module, "/v1") for module in _API_V1_HANDLERS]
+
+    for module, prefix in handlers:
+        api_router.include_router(importlib.import_module(module).router, prefix=prefix)
+
+    api_router.add_route(
+        "/{_:path}",
+        endpoint_not_found_controller,
+        methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
+        include_in_schema=False,
+    )
+
+    return api_router
@@ -12,7 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Any, List, Literal, Optional, Union
+import re
+from typing import Any, List, Literal, Optional
 from uuid import UUID
 
 from argilla_server.models import SuggestionType
@@ -20,17 +21,21 @@ from argilla_server.pydantic_v1 import BaseModel, Field
 from argilla_server.schemas.v1.questions import QuestionName
 
 AGENT_REGEX = r"^(?=.*[a-zA-Z0-9])[a-zA-Z0-9-_:\.\/\s]+$"
+AGENT_PATTERN = re.compile(AGENT_REGEX)
 AGENT_MIN_LENGTH = 1
 AGENT_MAX_LENGTH = 200
 
 SCORE_GREATER_THAN_OR_EQUAL = 0
 SCORE_LESS_THAN_OR_EQUAL = 1
 
+SUGGESTIONS_BULK_CREATE_MIN_ITEMS = 1
+SUGGESTIONS_BULK_CREATE_MAX_ITEMS = 1000
+
 
 class SuggestionFilterScope(BaseModel):
     entity: Literal["suggestion"]
     question: QuestionName
-    property: Optional[Union[Literal["value"], Literal["agent"], Literal["score"]]] = "value"
+    property: Optional[Literal["value", "agent", "score"]] = "value"
 
 
 class SearchSuggestionOptionsQuestion(BaseModel):
@@ -54,6 +59,11 @@ class BaseSuggestion(BaseModel):
     agent: Optional[str]
     score: Optional[float]
 
+    class Config:
+        # Suggestion instances are not copied when validated as fields of other models (e.g. records)
+        copy_on_model_validation = "none"
+        allow_mutation = False
+
 
 class Suggestion(BaseSuggestion):
     id: UUID
@@ -69,7 +79,7 @@ class Suggestions(BaseModel):
 class SuggestionCreate(BaseSuggestion):
     agent: Optional[str] = Field(
         None,
-        regex=AGENT_REGEX,
+        regex=AGENT_PATTERN,
         min_length=AGENT_MIN_LENGTH,
         max_length=AGENT_MAX_LENGTH,
         description="Agent used to generate the suggestion",
@@ -80,3 +90,28 @@ class SuggestionCreate(BaseSuggestion):
         le=SCORE_LESS_THAN_OR_EQUAL,
         description="The score assigned to the suggestion",
     )
+
+
+class SuggestionCreateWithRecordId(SuggestionCreate):
+    record_id: UUID
+
+
+class SuggestionsBulkCreate(BaseModel):
+    items: List[SuggestionCreateWithRecordId] = Field(
+        ...,
+        min_items=SUGGESTIONS_BULK_CREATE_MIN_ITEMS,
+        max_items=SUGGESTIONS_BULK_CREATE_MAX_ITEMS,
+    )
+
+
+class SuggestionBulkError(BaseModel):
+    detail: str
+
+
+class SuggestionBulk(BaseModel):
+    item: Optional[Suggestion]
+    error: Optional[SuggestionBulkError]
+
+
+class SuggestionsBulk(BaseModel):
+    items: List[SuggestionBulk]
@@ -20,12 +20,22 @@ import logging
 import os
 import re
 import warnings
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
-from urllib.parse import urlparse
 
 from argilla_server.constants import DEFAULT_MAX_KEYWORD_LENGTH, DEFAULT_TELEMETRY_KEY
-from argilla_server.pydantic_v1 import BaseSettings, Field, root_validator, validator
+from argilla_server.pydantic_v1 import BaseSettings, Field, PrivateAttr, root_validator, validator
+
+_SQLITE_DRIVER_REGEX = re.compile(r"^sqlite(?!\+aiosqlite)")
+_POSTGRESQL_DRIVER_REGEX = re.compile(r"^postgresql(?!\+asyncpg)(\+psycopg2)?")
+_ELASTICSEARCH_PASSWORD_REGEX = re.compile(r"(://[^:/@]*:)[^/?#]+(@)")
+
+
+@lru_cache(maxsize=None)
+def _ensure_home_path(home_path: str) -> None:
+    """Creates the home path directory only once per process and path"""
+    Path(home_path).mkdir(parents=True, exist_ok=True)
 
 
 class Settings(BaseSettings):
@@ -47,6 +57,9 @@ class Settings(BaseSettings):
     docs_enabled: True
         If True, enable openapi docs endpoint at /api/docs
 
+    enable_api_v0: (ENABLE_API_V0 env var)
+        If False, API v0 handlers are neither imported nor served. Default=True
+
     es_records_index_shards:
         Configures the number of shards for dataset records index creation. Default=1
 
@@ -74,8 +87,18 @@ class Settings(BaseSettings):
 
     docs_enabled: bool = True
 
+    enable_api_v0: bool = Field(
+        default=True,
+        description="If disabled, API v0 endpoints will not be loaded nor served",
+    )
+
     namespace: str = Field(default=None, regex=r"^[a-z]+$")
 
+    _dataset_index_name: str = PrivateAttr()
+    _dataset_records_index_name: str = PrivateAttr()
+    _old_dataset_index_name: str = PrivateAttr()
+    _old_dataset_records_index_name: str = PrivateAttr()
+
     enable_migration: bool = Field(
         default=False,
         description="If enabled, try to migrate data from old rubrix installation",
@@ -136,69 +159,76 @@ class Settings(BaseSettings):
             return f"sqlite+aiosqlite:///{sqlite_file}?check_same_thread=False"
 
         if "sqlite" in database_url:
-            regex = re.compile(r"sqlite(?!\+aiosqlite)")
-            if regex.match(database_url):
+            database_url, replacements = _SQLITE_DRIVER_REGEX.subn("sqlite+aiosqlite", database_url)
+            if replacements:
                 warnings.warn(
                     "From version 1.14.0, Argilla will use `aiosqlite` as default SQLite driver. The protocol in the"
                     " provided database URL has been automatically replaced from `sqlite` to `sqlite+aiosqlite`."
                     " Please, update your database URL to use `sqlite+aiosqlite` protocol."
                 )
-                return re.sub(regex, "sqlite+aiosqlite", database_url)
+                return database_url
 
         if "postgresql" in database_url:
-            regex = re.compile(r"postgresql(?!\+asyncpg)(\+psycopg2)?")
-            if regex.match(database_url):
+            database_url, replacements = _POSTGRESQL_DRIVER_REGEX.subn("postgresql+asyncpg", database_url)
+            if replacements:
                 warnings.warn(
                     "From version 1.14.0, Argilla will use `asyncpg` as default PostgreSQL driver. The protocol in the"
                     " provided database URL has been automatically replaced from `postgresql` to `postgresql+asyncpg`."
                     " Please, update your database URL to use `postgresql+asyncpg` protocol."
                 )
-                return re.sub(regex, "postgresql+asyncpg", database_url)
+                return database_url
 
         return database_url
 
     @root_validator(skip_on_failure=True)
     def create_home_path(cls, values):
-        Path(values["home_path"]).mkdir(parents=True, exist_ok=True)
+        _ensure_home_path(os.path.abspath(values["home_path"]))
 
         return values
 
+    def __init__(self, **values):
+        super().__init__(**values)
+        self._compute_index_names()
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name == "namespace":
+            self._compute_index_names()
+
+    def _compute_index_names(self) -> None:
+        """Computes the index names once, since they are read on every search engine request"""
+        ns = self.namespace
+
+        self._dataset_index_name = f"{ns}.{self.__DATASETS_INDEX_NAME__}" if ns else self.__DATASETS_INDEX_NAME__
+        self._dataset_records_index_name = (
+            f"{ns}.{self.__DATASETS_RECORDS_INDEX_NAME__}" if ns else self.__DATASETS_RECORDS_INDEX_NAME__
+        )
+        self._old_dataset_index_name = ".rubrix<NAMESPACE>.datasets-v0".replace(
+            "<NAMESPACE>", "" if ns is None else f".{ns}"
+        )
+        self._old_dataset_records_index_name = ".rubrix<NAMESPACE>.dataset.{}.records-v0".replace(
+            "<NAMESPACE>", "" if ns is None else f".{ns}"
+        )
+
     @property
     def dataset_index_name(self) -> str:
-        ns = self.namespace
-        if ns:
-            return f"{self.namespace}.{self.__DATASETS_INDEX_NAME__}"
-        return self.__DATASETS_INDEX_NAME__
+        return self._dataset_index_name
 
     @property
     def dataset_records_index_name(self) -> str:
-        ns = self.namespace
-        if ns:
-            return f"{self.namespace}.{self.__DATASETS_RECORDS_INDEX_NAME__}"
-        return self.__DATASETS_RECORDS_INDEX_NAME__
+        return self._dataset_records_index_name
 
     @property
     def old_dataset_index_name(self) -> str:
-        index_name = ".rubrix<NAMESPACE>.datasets-v0"
-        ns = self.namespace
-        if ns is None:
-            return index_name.replace("<NAMESPACE>", "")
-        return index_name.replace("<NAMESPACE>", f".{ns}")
+        return self._old_dataset_index_name
 
     @property
     def old_dataset_records_index_name(self) -> str:
-        index_name = ".rubrix<NAMESPACE>.dataset.{}.records-v0"
-        ns = self.namespace
-        if ns is None:
-            return index_name.replace("<NAMESPACE>", "")
-        return index_name.replace("<NAMESPACE>", f".{ns}")
+        return self._old_dataset_records_index_name
 
     def obfuscated_elasticsearch(self) -> str:
         """Returns configured elasticsearch url obfuscating the provided password, if any"""
-        parsed = urlparse(self.elasticsearch)
-        if parsed.password:
-            return self.elasticsearch.replace(parsed.password, "XXXX")
-        return self.elasticsearch
+        return _ELASTICSEARCH_PASSWORD_REGEX.sub(r"\1XXXX\2", self.elasticsearch)
 
     class Config:
         env_prefix = "ARGILLA_"
@@ -51,6 +51,10 @@ class TelemetryClient:
     def server_id(self) -> uuid.UUID:
         return self._server_id
 
+    @property
+    def enabled(self) -> bool:
+        return self.client is not None
+
     def __post_init__(self, enable_telemetry: bool, disable_send: bool, api_key: str, host: str):
         from argilla_server._version import __version__
 
@@ -11,11 +11,3 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-
-from uuid import UUID
-
-from argilla_server.schemas.v1.suggestions import SuggestionCreate
-
-
-class SuggestionCreateWithRecordId(SuggestionCreate):
-    record_id: UUID
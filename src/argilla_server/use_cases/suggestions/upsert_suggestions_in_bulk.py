@@ -0,0 +1,96 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from argilla_server.contexts import datasets
+from argilla_server.database import get_async_db
+from argilla_server.errors import future as errors
+from argilla_server.models import Record, User
+from argilla_server.policies import RecordPolicyV1, authorize
+from argilla_server.schemas.v1.suggestions import (
+    Suggestion,
+    SuggestionBulk,
+    SuggestionBulkError,
+    SuggestionCreateWithRecordId,
+)
+from argilla_server.search_engine import SearchEngine, get_search_engine
+
+
+class UpsertSuggestionsInBulkUseCase:
+    def __init__(self, db: AsyncSession, search_engine: SearchEngine):
+        self.db = db
+        self.search_engine = search_engine
+
+    async def execute(self, suggestions: List[SuggestionCreateWithRecordId], user: User) -> List[SuggestionBulk]:
+        suggestions_bulk_items: List[SuggestionBulk] = []
+        valid_suggestions: Dict[Tuple[UUID, UUID], SuggestionCreateWithRecordId] = {}
+
+        all_records = await datasets.get_records_by_ids(self.db, [item.record_id for item in suggestions])
+        non_empty_records = [r for r in all_records if r is not None]
+
+        await datasets.preload_records_relationships_before_validate(self.db, non_empty_records)
+        for item, record in zip(suggestions, all_records):
+            try:
+                await self._validate_suggestion(item, record, user)
+                if (item.record_id, item.question_id) in valid_suggestions:
+                    raise ValueError(
+                        f"suggestion for question_id={item.question_id} and record_id={item.record_id} is duplicated"
+                    )
+            except Exception as err:
+                suggestions_bulk_items.append(SuggestionBulk(item=None, error=SuggestionBulkError(detail=str(err))))
+            else:
+                valid_suggestions[(item.record_id, item.question_id)] = item
+                suggestions_bulk_items.append(SuggestionBulk(item=None, error=None))
+
+        if not valid_suggestions:
+            return suggestions_bulk_items
+
+        upserted_suggestions = await datasets.upsert_suggestions(
+            self.db, self.search_engine, list(valid_suggestions.values())
+        )
+        upserted_suggestions_by_key = {
+            (suggestion.record_id, suggestion.question_id): suggestion for suggestion in upserted_suggestions
+        }
+
+        for item, suggestion_bulk_item in zip(suggestions, suggestions_bulk_items):
+            if suggestion_bulk_item.error is None:
+                suggestion = upserted_suggestions_by_key[(item.record_id, item.question_id)]
+                suggestion_bulk_item.item = Suggestion.from_orm(suggestion)
+
+        return suggestions_bulk_items
+
+    @staticmethod
+    async def _validate_suggestion(item: SuggestionCreateWithRecordId, record: Optional[Record], user: User) -> None:
+        if record is None:
+            raise errors.NotFoundError(f"Record with id `{item.record_id}` not found")
+
+        await authorize(user, RecordPolicyV1.create_suggestion(record))
+
+        question = next((q for q in record.dataset.questions if q.id == item.question_id), None)
+        if question is None:
+            raise errors.NotFoundError(f"Question with id `{item.question_id}` not found")
+
+        question.parsed_settings.check_response(item)
+
+
+class UpsertSuggestionsInBulkUseCaseFactory:
+    def __call__(
+        self, db: AsyncSession = Depends(get_async_db), search_engine: SearchEngine = Depends(get_search_engine)
+    ):
+        return UpsertSuggestionsInBulkUseCase(db, search_engine)
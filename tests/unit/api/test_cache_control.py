@@ -0,0 +1,131 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+
+from tests.factories import DatasetFactory, TextFieldFactory, TextQuestionFactory
+
+
+@pytest.mark.asyncio
+class TestCacheControl:
+    async def test_dataset_settings_response_cache_headers(self, async_client: AsyncClient, owner_auth_header: dict):
+        dataset = await DatasetFactory.create()
+        await TextFieldFactory.create(dataset=dataset)
+
+        response = await async_client.get(f"/api/v1/datasets/{dataset.id}/fields", headers=owner_auth_header)
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "private, no-cache"
+        assert response.headers["etag"].startswith('W/"')
+
+    async def test_dataset_settings_response_not_modified(self, async_client: AsyncClient, owner_auth_header: dict):
+        dataset = await DatasetFactory.create()
+        await TextFieldFactory.create(dataset=dataset)
+
+        response = await async_client.get(f"/api/v1/datasets/{dataset.id}/fields", headers=owner_auth_header)
+        etag = response.headers["etag"]
+
+        response = await async_client.get(
+            f"/api/v1/datasets/{dataset.id}/fields",
+            headers={**owner_auth_header, "If-None-Match": etag},
+        )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+    @pytest.mark.parametrize(
+        "if_none_match",
+        [
+            '"other-etag", {etag}',
+            'W/"other-etag",{etag}',
+            "{strong_etag}",
+            '"other-etag", {strong_etag}',
+            "*",
+        ],
+    )
+    async def test_dataset_settings_response_not_modified_with_if_none_match(
+        self, async_client: AsyncClient, owner_auth_header: dict, if_none_match: str
+    ):
+        dataset = await DatasetFactory.create()
+        await TextFieldFactory.create(dataset=dataset)
+
+        response = await async_client.get(f"/api/v1/datasets/{dataset.id}/fields", headers=owner_auth_header)
+        etag = response.headers["etag"]
+
+        response = await async_client.get(
+            f"/api/v1/datasets/{dataset.id}/fields",
+            headers={
+                **owner_auth_header,
+                "If-None-Match": if_none_match.format(etag=etag, strong_etag=etag[2:]),
+            },
+        )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+    async def test_dataset_settings_response_with_not_matching_if_none_match(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        await TextFieldFactory.create(dataset=dataset)
+
+        response = await async_client.get(
+            f"/api/v1/datasets/{dataset.id}/fields",
+            headers={**owner_auth_header, "If-None-Match": 'W/"other-etag", "another-etag"'},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["items"]
+
+    async def test_dataset_settings_response_after_update(self, async_client: AsyncClient, owner_auth_header: dict):
+        dataset = await DatasetFactory.create()
+        question = await TextQuestionFactory.create(dataset=dataset, title="Old title")
+
+        response = await async_client.get(f"/api/v1/datasets/{dataset.id}/questions", headers=owner_auth_header)
+        etag = response.headers["etag"]
+
+        response = await async_client.patch(
+            f"/api/v1/questions/{question.id}", headers=owner_auth_header, json={"title": "New title"}
+        )
+        assert response.status_code == 200
+
+        response = await async_client.get(
+            f"/api/v1/datasets/{dataset.id}/questions",
+            headers={**owner_auth_header, "If-None-Match": etag},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["items"][0]["title"] == "New title"
+
+    async def test_dataset_settings_error_response_without_cache_headers(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        response = await async_client.get(f"/api/v1/datasets/{uuid4()}/fields", headers=owner_auth_header)
+
+        assert response.status_code == 404
+        assert "cache-control" not in response.headers
+        assert "etag" not in response.headers
+
+    async def test_other_endpoints_without_cache_headers(self, async_client: AsyncClient, owner_auth_header: dict):
+        dataset = await DatasetFactory.create()
+
+        response = await async_client.get(f"/api/v1/datasets/{dataset.id}", headers=owner_auth_header)
+
+        assert response.status_code == 200
+        assert "cache-control" not in response.headers
@@ -0,0 +1,100 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import List, Type
+
+import pytest
+from argilla_server.apis.routing import LazyAPIRoute
+from argilla_server.pydantic_v1 import BaseModel
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+from httpx import AsyncClient
+
+
+class Item(BaseModel):
+    name: str
+
+
+def create_app(route_class: Type[APIRoute]) -> FastAPI:
+    router = APIRouter(route_class=route_class, tags=["items"])
+
+    @router.get("/items", response_model=List[Item])
+    async def list_items(limit: int = 10):
+        """List items."""
+        return [{"name": "item"}]
+
+    @router.post("/items", status_code=201)
+    async def create_item(item: Item) -> Item:
+        return item
+
+    api_router = APIRouter()
+    api_router.include_router(router, prefix="/v1")
+
+    app = FastAPI()
+    app.include_router(api_router, prefix="/api")
+
+    return app
+
+
+def lazy_routes(app: FastAPI) -> List[LazyAPIRoute]:
+    return [route for route in app.routes if isinstance(route, LazyAPIRoute)]
+
+
+class TestLazyAPIRoute:
+    def test_include_router_does_not_initialize_routes(self):
+        app = create_app(LazyAPIRoute)
+
+        routes = lazy_routes(app)
+
+        assert [(route.path, route.methods) for route in routes] == [
+            ("/api/v1/items", {"GET"}),
+            ("/api/v1/items", {"POST"}),
+        ]
+        assert all("dependant" not in route.__dict__ for route in routes)
+
+    @pytest.mark.asyncio
+    async def test_request_initializes_routed_route(self):
+        app = create_app(LazyAPIRoute)
+        list_route, create_route = lazy_routes(app)
+
+        async with AsyncClient(app=app, base_url="http://testserver") as client:
+            response = await client.get("/api/v1/items")
+
+        assert response.status_code == 200
+        assert response.json() == [{"name": "item"}]
+        assert "dependant" in list_route.__dict__
+        assert "dependant" not in create_route.__dict__
+
+    def test_initialize(self):
+        app = create_app(LazyAPIRoute)
+
+        for route in lazy_routes(app):
+            route.initialize()
+
+        assert all("dependant" in route.__dict__ for route in lazy_routes(app))
+
+    def test_initialize_with_invalid_route_definition(self):
+        class NotAModel:
+            pass
+
+        router = APIRouter(route_class=LazyAPIRoute)
+        router.add_api_route("/bad", lambda: None, response_model=NotAModel)
+        (route,) = router.routes
+
+        for _ in range(2):
+            with pytest.raises(Exception, match="NotAModel"):
+                route.initialize()
+
+    def test_openapi_is_not_changed(self):
+        assert create_app(LazyAPIRoute).openapi() == create_app(APIRoute).openapi()
@@ -12,6 +12,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import json
 from typing import TYPE_CHECKING
 
 import pytest
@@ -30,9 +31,16 @@ from argilla_server.apis.v0.models.token_classification import (
 from argilla_server.commons.models import TaskType
 from argilla_server.constants import API_KEY_HEADER_NAME
 from argilla_server.models import User, UserRole
+from argilla_server.routes import create_api_router
 from argilla_server.services.metrics.models import CommonTasksMetrics
-from argilla_server.services.tasks.text_classification.metrics import TextClassificationMetrics
+from argilla_server.services.tasks.text_classification.metrics import F1Metric, TextClassificationMetrics
+from argilla_server.services.tasks.text_classification.model import (
+    ClassPrediction,
+    ServiceTextClassificationRecord,
+    TextClassificationAnnotation,
+)
 from argilla_server.services.tasks.token_classification.metrics import TokenClassificationMetrics
+from fastapi.encoders import jsonable_encoder
 
 from tests.factories import UserFactory, WorkspaceFactory
 
@@ -313,6 +321,62 @@ async def test_labeling_rule_metric(async_client: "AsyncClient", argilla_user: U
     }
 
 
+@pytest.mark.asyncio
+async def test_f1_metric_summary(async_client: "AsyncClient", argilla_user: User):
+    async_client.headers.update({API_KEY_HEADER_NAME: argilla_user.api_key})
+    workspace_query_params = {"workspace": argilla_user.username}
+
+    dataset = "test_f1_metric_summary"
+    await create_some_classification_data(
+        async_client,
+        dataset,
+        records=[
+            {
+                "inputs": {"text": "Some test data"},
+                "prediction": {"agent": "test", "labels": [{"class": prediction}]},
+                "annotation": {"agent": "test", "labels": [{"class": annotation}]},
+            }
+            for prediction, annotation in [("A", "A"), ("B", "B"), ("A", "B")]
+        ],
+        workspace_name=argilla_user.username,
+    )
+
+    response = await async_client.post(
+        f"/api/datasets/TextClassification/{dataset}/metrics/F1:summary",
+        json={},
+        params=workspace_query_params,
+    )
+
+    assert response.status_code == 200
+
+    summary = response.json()
+    assert summary["precision_macro"] == pytest.approx(0.75)
+    assert summary["recall_macro"] == pytest.approx(0.75)
+    assert summary["f1_micro"] == pytest.approx(2 / 3)
+    assert summary["A_precision"] == pytest.approx(0.5)
+    assert summary["B_recall"] == pytest.approx(0.5)
+
+
+def test_f1_metric_summary_response():
+    records = [
+        ServiceTextClassificationRecord(
+            inputs={"text": "Some test data"},
+            prediction=TextClassificationAnnotation(agent="test", labels=[ClassPrediction(class_label=prediction)]),
+            annotation=TextClassificationAnnotation(agent="test", labels=[ClassPrediction(class_label=annotation)]),
+        )
+        for prediction, annotation in [("A", "A"), ("B", "B"), ("A", "B")]
+    ]
+    summary = F1Metric(id="F1", name="F1", description="F1").apply(records)
+
+    # scikit-learn returns numpy floats, which must be supported by the metric summary response class
+    route = next(route for route in create_api_router().routes if getattr(route, "name", None) == "metric_summary")
+    response = route.response_class(jsonable_encoder(summary))
+
+    summary = json.loads(response.body)
+    assert summary["precision_macro"] == pytest.approx(0.75)
+    assert summary["f1_micro"] == pytest.approx(2 / 3)
+
+
 @pytest.mark.asyncio
 async def test_dataset_labels_for_text_classification(async_client: "AsyncClient", argilla_user: User):
     async_client.headers.update({API_KEY_HEADER_NAME: argilla_user.api_key})
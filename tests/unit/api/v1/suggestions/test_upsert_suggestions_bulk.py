@@ -0,0 +1,194 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from uuid import UUID, uuid4
+
+import pytest
+from argilla_server.constants import API_KEY_HEADER_NAME
+from argilla_server.enums import SuggestionType
+from argilla_server.models import Suggestion
+from argilla_server.search_engine import SearchEngine
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.factories import (
+    AnnotatorFactory,
+    DatasetFactory,
+    RecordFactory,
+    SuggestionFactory,
+    TextQuestionFactory,
+    WorkspaceUserFactory,
+)
+
+
+@pytest.mark.asyncio
+class TestUpsertSuggestionsBulk:
+    def url(self) -> str:
+        return "/api/v1/suggestions/bulk"
+
+    def bulk_max_items(self) -> int:
+        return 1000
+
+    async def test_multiple_suggestions(
+        self, async_client: AsyncClient, db: AsyncSession, mock_search_engine: SearchEngine, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        question = await TextQuestionFactory.create(dataset=dataset)
+        records = await RecordFactory.create_batch(2, dataset=dataset)
+
+        suggestion_to_update = await SuggestionFactory.create(question=question, record=records[1], value="old value")
+
+        non_existent_record_id = uuid4()
+        other_question = await TextQuestionFactory.create()
+
+        resp = await async_client.post(
+            self.url(),
+            headers=owner_auth_header,
+            json={
+                "items": [
+                    {
+                        "record_id": str(records[0].id),
+                        "question_id": str(question.id),
+                        "type": SuggestionType.model,
+                        "value": "value",
+                        "agent": "agent",
+                        "score": 0.5,
+                    },
+                    {
+                        "record_id": str(records[1].id),
+                        "question_id": str(question.id),
+                        "value": "new value",
+                    },
+                    {
+                        "record_id": str(non_existent_record_id),
+                        "question_id": str(question.id),
+                        "value": "value",
+                    },
+                    {
+                        "record_id": str(records[0].id),
+                        "question_id": str(other_question.id),
+                        "value": "value",
+                    },
+                ],
+            },
+        )
+
+        assert resp.status_code == 200
+
+        resp_json = resp.json()
+        suggestion_to_create_id = UUID(resp_json["items"][0]["item"]["id"])
+        assert resp_json == {
+            "items": [
+                {
+                    "item": {
+                        "id": str(suggestion_to_create_id),
+                        "question_id": str(question.id),
+                        "type": SuggestionType.model,
+                        "value": "value",
+                        "agent": "agent",
+                        "score": 0.5,
+                    },
+                    "error": None,
+                },
+                {
+                    "item": {
+                        "id": str(suggestion_to_update.id),
+                        "question_id": str(question.id),
+                        "type": None,
+                        "value": "new value",
+                        "agent": None,
+                        "score": None,
+                    },
+                    "error": None,
+                },
+                {
+                    "item": None,
+                    "error": {"detail": f"Record with id `{non_existent_record_id}` not found"},
+                },
+                {
+                    "item": None,
+                    "error": {"detail": f"Question with id `{other_question.id}` not found"},
+                },
+            ],
+        }
+
+        assert (await db.execute(select(func.count(Suggestion.id)))).scalar() == 2
+        assert mock_search_engine.update_record_suggestion.call_count == 2
+
+    async def test_with_duplicated_suggestions(
+        self, async_client: AsyncClient, db: AsyncSession, owner_auth_header: dict
+    ):
+        record = await RecordFactory.create()
+        question = await TextQuestionFactory.create(dataset=record.dataset)
+        suggestion_json = {"record_id": str(record.id), "question_id": str(question.id), "value": "value"}
+
+        resp = await async_client.post(
+            self.url(), headers=owner_auth_header, json={"items": [suggestion_json, suggestion_json]}
+        )
+
+        assert resp.status_code == 200
+
+        resp_json = resp.json()
+        assert resp_json["items"][0]["error"] is None
+        assert resp_json["items"][1] == {
+            "item": None,
+            "error": {
+                "detail": f"suggestion for question_id={question.id} and record_id={record.id} is duplicated",
+            },
+        }
+
+        assert (await db.execute(select(func.count(Suggestion.id)))).scalar() == 1
+
+    async def test_as_annotator(self, async_client: AsyncClient, db: AsyncSession, mock_search_engine: SearchEngine):
+        record = await RecordFactory.create()
+        question = await TextQuestionFactory.create(dataset=record.dataset)
+
+        annotator = await AnnotatorFactory.create()
+        await WorkspaceUserFactory.create(user_id=annotator.id, workspace_id=record.dataset.workspace_id)
+
+        resp = await async_client.post(
+            self.url(),
+            headers={API_KEY_HEADER_NAME: annotator.api_key},
+            json={"items": [{"record_id": str(record.id), "question_id": str(question.id), "value": "value"}]},
+        )
+
+        assert resp.status_code == 200
+        assert resp.json() == {
+            "items": [
+                {
+                    "item": None,
+                    "error": {"detail": "argilla.api.errors::ForbiddenOperationError(detail=Operation not allowed)"},
+                },
+            ],
+        }
+
+        assert (await db.execute(select(func.count(Suggestion.id)))).scalar() == 0
+        assert not mock_search_engine.update_record_suggestion.called
+
+    async def test_with_too_many_items(self, async_client: AsyncClient, owner_auth_header: dict):
+        suggestion_json = {"record_id": str(uuid4()), "question_id": str(uuid4()), "value": "value"}
+
+        resp = await async_client.post(
+            self.url(),
+            headers=owner_auth_header,
+            json={"items": [suggestion_json] * (self.bulk_max_items() + 1)},
+        )
+
+        assert resp.status_code == 422
+
+    async def test_with_empty_items(self, async_client: AsyncClient, owner_auth_header: dict):
+        resp = await async_client.post(self.url(), headers=owner_auth_header, json={"items": []})
+
+        assert resp.status_code == 422
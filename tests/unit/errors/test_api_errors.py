@@ -12,8 +12,13 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
+import json
+from typing import TYPE_CHECKING
+
 import pytest
-from argilla_server.errors.api_errors import APIErrorHandler
+from argilla_server import telemetry
+from argilla_server.errors.api_errors import _TRACK_ERROR_TASKS, APIErrorHandler
 from argilla_server.errors.base_errors import (
     EntityAlreadyExistsError,
     EntityNotFoundError,
@@ -23,6 +28,9 @@ from argilla_server.errors.base_errors import (
 from argilla_server.schemas.v0.datasets import Dataset
 from fastapi import Request
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 mock_request = Request(scope={"type": "http", "headers": {}})
 
 
@@ -73,3 +81,72 @@ class TestAPIErrorHandler:
         await APIErrorHandler.track_error(error, request=mock_request)
 
         test_telemetry.track_data.assert_called_once_with(action="ServerErrorFound", data=expected_event)
+
+    async def test_common_exception_handler_tracks_error_in_background(self, test_telemetry):
+        error = EntityNotFoundError(name="mock-name", type="MockType")
+
+        response = await APIErrorHandler.common_exception_handler(mock_request, error)
+        assert response.status_code == 404
+
+        await asyncio.gather(*_TRACK_ERROR_TASKS)
+        test_telemetry.track_data.assert_called_once_with(
+            action="ServerErrorFound",
+            data={
+                "accept-language": None,
+                "code": "argilla.api.errors::EntityNotFoundError",
+                "type": "MockType",
+                "user-agent": None,
+            },
+        )
+
+    @pytest.mark.parametrize(
+        ["error", "expected_detail"],
+        [
+            (ServerError(), {"code": "argilla.api.errors::ServerError", "params": {}}),
+            (
+                EntityNotFoundError(name="mock-name", type="MockType"),
+                {
+                    "code": "argilla.api.errors::EntityNotFoundError",
+                    "params": {"name": "mock-name", "type": "MockType"},
+                },
+            ),
+        ],
+    )
+    async def test_common_exception_handler_response(self, test_telemetry, error, expected_detail):
+        response = await APIErrorHandler.common_exception_handler(mock_request, error)
+        await asyncio.gather(*_TRACK_ERROR_TASKS)
+
+        assert json.loads(response.body) == {"detail": expected_detail}
+
+    async def test_track_error_in_background_gets_telemetry_client_once(self, test_telemetry, mocker: "MockerFixture"):
+        get_telemetry_client_spy = mocker.spy(telemetry, "get_telemetry_client")
+
+        APIErrorHandler.track_error_in_background(ServerError(), request=mock_request)
+        await asyncio.gather(*_TRACK_ERROR_TASKS)
+
+        get_telemetry_client_spy.assert_called_once()
+        test_telemetry.track_data.assert_called_once()
+
+    async def test_common_exception_handler_logs_track_error_exception(self, test_telemetry, mocker: "MockerFixture"):
+        logger_mock = mocker.patch("argilla_server.errors.api_errors._LOGGER")
+        tracking_error = RuntimeError("telemetry failure")
+        test_telemetry.track_data.side_effect = tracking_error
+
+        response = await APIErrorHandler.common_exception_handler(mock_request, ServerError())
+        assert response.status_code == 500
+        assert json.loads(response.body) == {"detail": {"code": "argilla.api.errors::ServerError", "params": {}}}
+
+        await asyncio.gather(*_TRACK_ERROR_TASKS, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert not _TRACK_ERROR_TASKS
+        logger_mock.warning.assert_called_once_with("Error tracking server error", exc_info=tracking_error)
+
+    async def test_common_exception_handler_with_telemetry_disabled(self, test_telemetry):
+        test_telemetry.enabled = False
+
+        response = await APIErrorHandler.common_exception_handler(mock_request, ServerError())
+        assert response.status_code == 500
+
+        assert not _TRACK_ERROR_TASKS
+        test_telemetry.track_data.assert_not_called()
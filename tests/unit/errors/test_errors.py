@@ -12,9 +12,27 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from argilla_server.errors import GenericServerError
+from argilla_server.errors import EntityNotFoundError, GenericServerError
 
 
 def test_generic_error():
     err = GenericServerError(error=ValueError("this is an error"))
     assert str(err) == "argilla.api.errors::GenericServerError(type=builtins.ValueError,message=this is an error)"
+
+
+def test_openapi_response():
+    assert GenericServerError.OPENAPI_RESPONSE == {
+        "content": {"application/json": {"example": {"detail": {"code": "builtins.TypeError"}}}},
+    }
+    assert EntityNotFoundError.OPENAPI_RESPONSE == {
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": {
+                        "code": "argilla.api.errors::EntityNotFoundError",
+                        "params": {"extra": "error parameters"},
+                    }
+                }
+            }
+        },
+    }
@@ -16,6 +16,7 @@ from typing import cast
 import pytest
 from argilla_server._app import create_server_app
 from argilla_server.settings import Settings, settings
+from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.routing import Mount
 from starlette.testclient import TestClient
 
@@ -25,6 +26,7 @@ def test_settings():
     yield settings
 
     settings.base_url = "/"
+    settings.enable_api_v0 = True
 
 
 class TestApp:
@@ -49,3 +51,24 @@ class TestApp:
 
         assert len(app.routes) == 1
         assert cast(Mount, app.routes[0]).path == base_url
+
+    def test_create_app_with_api_v0_disabled(self, test_settings: Settings):
+        settings.enable_api_v0 = False
+
+        app = create_server_app()
+        client = TestClient(app)
+
+        response = client.get("/api/_info")
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Endpoint '/api/_info' not found"}
+
+        response = client.get("/api/docs/spec.json")
+        assert response.status_code == 200
+        assert all(path.startswith("/api/v1/") for path in response.json()["paths"])
+
+    def test_create_app_without_base_http_middlewares(self):
+        app = create_server_app()
+
+        assert app.user_middleware
+        for middleware in app.user_middleware:
+            assert not issubclass(middleware.cls, BaseHTTPMiddleware)